@@ -61,7 +61,10 @@ def main():
     
     # Initialize core components
     session_manager = SessionManager()
-    explorer = WordNetExplorer()
+    # Reuse the explorer across reruns instead of re-initializing WordNet each time
+    if 'explorer' not in st.session_state:
+        st.session_state.explorer = WordNetExplorer()
+    explorer = st.session_state.explorer
     
     # Load custom CSS
     load_custom_css()
@@ -264,9 +264,9 @@ class WordNetExplorer:
             node_labels[breadcrumb_node] = f"← {previous_word.upper()}"
             
             # Connect breadcrumb to a main node if available
-            main_nodes = [n for n, d in G.nodes(data=True) if d.get('node_type') == 'main']
-            if main_nodes:
-                G.add_edge(breadcrumb_node, main_nodes[0], 
+            main_node = next((n for n, t in G.nodes(data='node_type') if t == 'main'), None)
+            if main_node is not None:
+                G.add_edge(breadcrumb_node, main_node, 
                           relation='breadcrumb', 
                           color='#CCCCCC',
                           arrow_direction='to')
@@ -475,68 +475,58 @@ class GraphBuilder:
     
     def _add_cross_connections(self, G: nx.Graph, node_labels: Dict):
         """Add cross-connections between existing nodes in the graph."""
-        synset_nodes = [node for node, data in G.nodes(data=True) 
-                       if data.get('node_type') == 'synset']
+        from nltk.corpus import wordnet as wn
         
-        # For each pair of synset nodes, check if they have relationships
-        for i, source_node in enumerate(synset_nodes):
-            if i >= len(synset_nodes) - 1:  # Don't check the last node against nothing
-                break
-                
-            source_synset_name = G.nodes[source_node].get('synset_name')
-            if not source_synset_name:
+        # Resolve each synset node and its relationships once up front rather
+        # than once per pair; related synsets are kept as sets for fast lookup
+        resolved = []
+        for node, data in G.nodes(data=True):
+            if data.get('node_type') != 'synset':
+                continue
+            synset_name = data.get('synset_name')
+            if not synset_name:
                 continue
-                
             try:
-                from nltk.corpus import wordnet as wn
-                source_synset = wn.synset(source_synset_name)
-                relationships = get_relationships(source_synset, self.config.relationship_config)
-                
-                # Check if any of the remaining nodes are related to this source
-                for target_node in synset_nodes[i+1:]:
-                    target_synset_name = G.nodes[target_node].get('synset_name')
-                    if not target_synset_name:
-                        continue
-                        
-                    try:
-                        target_synset = wn.synset(target_synset_name)
-                        
-                        # Check if these synsets are related
-                        for rel_type, related_synsets in relationships.items():
-                            if target_synset in related_synsets:
-                                # Add edge if it doesn't exist
-                                if not G.has_edge(source_node, target_node):
-                                    rel_props = get_relationship_properties(rel_type)
-                                    arrow_direction = rel_props.get('arrow_direction', 'to')
-                                    
-                                    # Respect arrow direction when adding cross-connections
-                                    if arrow_direction == 'from':
-                                        actual_source, actual_target = target_node, source_node
-                                    else:
-                                        actual_source, actual_target = source_node, target_node
-                                        
-                                    if not G.has_edge(actual_source, actual_target):
-                                        G.add_edge(actual_source, actual_target, **rel_props)
-                                    
-                        # Also check reverse relationships (target -> source)
-                        target_relationships = get_relationships(target_synset, self.config.relationship_config)
-                        for rel_type, related_synsets in target_relationships.items():
-                            if source_synset in related_synsets:
-                                # Add edge if it doesn't exist (reverse direction)
-                                rel_props = get_relationship_properties(rel_type)
-                                arrow_direction = rel_props.get('arrow_direction', 'to')
+                synset = wn.synset(synset_name)
+                relationships = get_relationships(synset, self.config.relationship_config)
+            except Exception:
+                continue  # Skip invalid synset names
+            related = [(rel_type, set(related_synsets))
+                       for rel_type, related_synsets in relationships.items()]
+            resolved.append((node, synset, related))
+        
+        # For each pair of synset nodes, check if they have relationships
+        for i, (source_node, source_synset, source_related) in enumerate(resolved):
+            for target_node, target_synset, target_related in resolved[i+1:]:
+                # Check if these synsets are related
+                for rel_type, related_synsets in source_related:
+                    if target_synset in related_synsets:
+                        # Add edge if it doesn't exist
+                        if not G.has_edge(source_node, target_node):
+                            rel_props = get_relationship_properties(rel_type)
+                            arrow_direction = rel_props.get('arrow_direction', 'to')
+                            
+                            # Respect arrow direction when adding cross-connections
+                            if arrow_direction == 'from':
+                                actual_source, actual_target = target_node, source_node
+                            else:
+                                actual_source, actual_target = source_node, target_node
                                 
-                                # Respect arrow direction when adding reverse cross-connections
-                                if arrow_direction == 'from':
-                                    actual_source, actual_target = source_node, target_node
-                                else:
-                                    actual_source, actual_target = target_node, source_node
-                                    
-                                if not G.has_edge(actual_source, actual_target):
-                                    G.add_edge(actual_source, actual_target, **rel_props)
-                                    
-                    except Exception:
-                        continue  # Skip invalid synset names
+                            if not G.has_edge(actual_source, actual_target):
+                                G.add_edge(actual_source, actual_target, **rel_props)
+                
+                # Also check reverse relationships (target -> source)
+                for rel_type, related_synsets in target_related:
+                    if source_synset in related_synsets:
+                        # Add edge if it doesn't exist (reverse direction)
+                        rel_props = get_relationship_properties(rel_type)
+                        arrow_direction = rel_props.get('arrow_direction', 'to')
                         
-            except Exception:
-                continue  # Skip invalid synset names 
\ No newline at end of file
+                        # Respect arrow direction when adding reverse cross-connections
+                        if arrow_direction == 'from':
+                            actual_source, actual_target = source_node, target_node
+                        else:
+                            actual_source, actual_target = target_node, source_node
+                            
+                        if not G.has_edge(actual_source, actual_target):
+                            G.add_edge(actual_source, actual_target, **rel_props)
\ No newline at end of file
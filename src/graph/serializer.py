@@ -87,8 +87,8 @@ class GraphSerializer:
             metadata=metadata
         )
         
-        # Convert to JSON
-        return json.dumps(asdict(serialized), indent=2)
+        # Convert to JSON; vars() gives the fields in order without asdict()'s deep copy
+        return json.dumps(vars(serialized), indent=2)
     
     def deserialize_graph(self, json_str: str) -> Tuple[nx.Graph, Dict[str, str], Dict[str, Any]]:
         """
@@ -26,6 +26,28 @@ class VisualizationConfig:
     width: str = "100%"
 
 
+# Edge tooltip templates keyed by relation, phrased for the visual arrow direction
+# (taxonomic arrows always point specific → general)
+_EDGE_DESCRIPTIONS = {
+    'sense': "Word sense connection: {source} → {target}",
+    'hypernym': "Is-a relationship: {source} is a type of {target}",
+    'hyponym': "Is-a relationship: {source} is a type of {target}",
+    'member_meronym': "Part-of relationship: {source} is part of {target}",
+    'substance_meronym': "Part-of relationship: {source} is part of {target}",
+    'part_meronym': "Part-of relationship: {source} is part of {target}",
+    'member_holonym': "Has-part relationship: {source} has part {target}",
+    'substance_holonym': "Has-part relationship: {source} has part {target}",
+    'part_holonym': "Has-part relationship: {source} has part {target}",
+    'similar_to': "Similar to: {source} is similar to {target}",
+    'antonym': "Opposite of: {source} is opposite to {target}",
+    'also_see': "Related to: {source} is also related to {target}",
+    'entailment': "Entails: {source} entails {target}",
+    'entails': "Entails: {source} entails {target}",
+    'cause': "Causes: {source} causes {target}",
+    'causes': "Causes: {source} causes {target}",
+}
+
+
 class GraphVisualizer:
     """Handles graph visualization using pyvis and matplotlib."""
     
@@ -249,17 +271,25 @@ class GraphVisualizer:
     
     def _add_nodes(self, net: Network, G: nx.Graph, node_labels: Dict):
         """Add nodes to the pyvis network."""
-        colors = self.color_schemes.get(self.config.color_scheme, 
+        colors = self.color_schemes.get(self.config.color_scheme,
                                        self.color_schemes["Default"])
-        
-        for node in G.nodes():
-            node_data = G.nodes[node]
+        pos_colors = self.pos_colors.get(self.config.color_scheme, self.pos_colors["Default"])
+
+        # Per-type values are the same for every node, so compute them once
+        multiplier = self.config.node_size_multiplier
+        breadcrumb_size = int(20 * multiplier)
+        main_size = int(30 * multiplier)
+        sense_size = int(25 * multiplier)
+        default_size = int(20 * multiplier)
+        font = {'size': int(12 * multiplier), 'color': 'black'}
+
+        for node, node_data in G.nodes(data=True):
             node_type = node_data.get('node_type', 'unknown')
             
             # Configure node based on type
             if node_type == 'breadcrumb':
                 color = '#CCCCCC'
-                size = int(20 * self.config.node_size_multiplier)
+                size = breadcrumb_size
                 title = f"Back to: {node_data.get('original_word', 'Previous word')}"
                 node_style = {
                     'borderWidth': 3,
@@ -269,12 +299,12 @@ class GraphVisualizer:
                 }
             elif node_type == 'main':
                 color = colors["main"]
-                size = int(30 * self.config.node_size_multiplier)
+                size = main_size
                 title = f"Main word: {node_data.get('word', '').upper()}"
                 node_style = {}
             elif node_type == 'word_sense':
                 color = colors.get("word_sense", "#FFB347")  # Orange for word senses
-                size = int(25 * self.config.node_size_multiplier)
+                size = sense_size
                 synset_name = node_data.get('synset_name', node)
                 definition = node_data.get('definition', 'No definition')
                 word = node_data.get('word', '')
@@ -284,9 +314,8 @@ class GraphVisualizer:
             elif node_type == 'synset':
                 # Get POS for color selection
                 pos = node_data.get('pos', 'n')  # Default to noun if POS not found
-                pos_colors = self.pos_colors.get(self.config.color_scheme, self.pos_colors["Default"])
                 color = pos_colors.get(pos, pos_colors.get('n', '#FFB6C1'))  # Default to noun color
-                size = int(25 * self.config.node_size_multiplier)
+                size = sense_size
                 synset_name = node_data.get('synset_name', node)
                 definition = node_data.get('definition', 'No definition')
                 pos_label = node_data.get('pos_label', 'noun')
@@ -294,7 +323,7 @@ class GraphVisualizer:
                 node_style = {'shape': 'square'}
             else:
                 color = colors.get("synset", "#CCCCCC")
-                size = int(20 * self.config.node_size_multiplier)
+                size = default_size
                 title = f"Node: {node_labels.get(node, node)}"
                 node_style = {}
             
@@ -305,7 +334,7 @@ class GraphVisualizer:
                 'color': color,
                 'size': size,
                 'title': title,
-                'font': {'size': int(12 * self.config.node_size_multiplier), 'color': 'black'}
+                'font': dict(font)
             }
             node_config.update(node_style)
             
@@ -358,25 +387,9 @@ class GraphVisualizer:
             target_name = actual_target.split('.')[0] if '.' in actual_target else actual_target.split('_')[-1]
             
             # Generate semantic description based on the visual arrow direction
-            if relation == 'sense':
-                description = f"Word sense connection: {source_name} → {target_name}"
-            elif relation in ['hypernym', 'hyponym']:
-                # Both hypernyms and hyponyms now have consistent visual direction: specific → general
-                description = f"Is-a relationship: {source_name} is a type of {target_name}"
-            elif relation in ['member_meronym', 'substance_meronym', 'part_meronym']:
-                description = f"Part-of relationship: {source_name} is part of {target_name}"
-            elif relation in ['member_holonym', 'substance_holonym', 'part_holonym']:
-                description = f"Has-part relationship: {source_name} has part {target_name}"
-            elif relation == 'similar_to':
-                description = f"Similar to: {source_name} is similar to {target_name}"
-            elif relation == 'antonym':
-                description = f"Opposite of: {source_name} is opposite to {target_name}"
-            elif relation == 'also_see':
-                description = f"Related to: {source_name} is also related to {target_name}"
-            elif relation in ['entailment', 'entails']:
-                description = f"Entails: {source_name} entails {target_name}"
-            elif relation in ['cause', 'causes']:
-                description = f"Causes: {source_name} causes {target_name}"
+            template = _EDGE_DESCRIPTIONS.get(relation)
+            if template is not None:
+                description = template.format(source=source_name, target=target_name)
             else:
                 description = f"{relation.replace('_', ' ').title()}: {source_name} → {target_name}"
             
@@ -0,0 +1,62 @@
+"""
+Tests for relationship configuration.
+"""
+
+import copy
+import unittest
+import sys
+import os
+
+# Add parent directories to path for imports
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.dirname(current_dir)
+parent_dir = os.path.dirname(src_dir)
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+
+# Now we can import with src prefix
+from src.wordnet.relationships import RelationshipConfig
+
+
+class TestRelationshipConfig(unittest.TestCase):
+    """Test the immutable, hashable RelationshipConfig."""
+
+    def test_equal_flags_equal_hash(self):
+        """Test that configs with the same flags are equal and hash alike."""
+        config1 = RelationshipConfig(show_hypernyms=True, show_antonym=True)
+        config2 = RelationshipConfig(show_hypernyms=True, show_antonym=True)
+        self.assertEqual(config1, config2)
+        self.assertEqual(hash(config1), hash(config2))
+
+    def test_different_flags_not_equal(self):
+        """Test that configs with different flags compare unequal."""
+        config1 = RelationshipConfig(show_hypernyms=True)
+        config2 = RelationshipConfig(show_hypernyms=False)
+        self.assertNotEqual(config1, config2)
+
+    def test_assignment_raises(self):
+        """Test that flags cannot be changed after construction."""
+        config = RelationshipConfig(show_hypernym=True)
+        with self.assertRaises(AttributeError):
+            config.show_hypernym = False
+        self.assertTrue(config.show_hypernym)
+
+    def test_deletion_raises(self):
+        """Test that flags cannot be deleted after construction."""
+        config = RelationshipConfig(show_hypernym=True)
+        with self.assertRaises(AttributeError):
+            del config.show_hypernym
+        # The config must stay hashable
+        hash(config)
+
+    def test_copies_are_self(self):
+        """Test that copying returns the same immutable instance."""
+        config = RelationshipConfig(show_hyponyms=True)
+        self.assertIs(copy.copy(config), config)
+        self.assertIs(copy.deepcopy(config), config)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -58,7 +58,47 @@ class RelationshipType(Enum):
 
 
 class RelationshipConfig:
-    """Configuration for comprehensive relationship extraction."""
+    """Configuration for comprehensive relationship extraction.
+    
+    Instances are immutable and hashable, so one config can be shared
+    between graph builds and used as a cache key.
+    """
+    
+    # Configuration flags, in the order used for equality and hashing
+    _FIELDS = (
+        'include_hypernyms',
+        'include_hyponyms',
+        'include_meronyms',
+        'include_holonyms',
+        'show_hypernym',
+        'show_hyponym',
+        'show_instance_hypernym',
+        'show_instance_hyponym',
+        'show_member_holonym',
+        'show_substance_holonym',
+        'show_part_holonym',
+        'show_member_meronym',
+        'show_substance_meronym',
+        'show_part_meronym',
+        'show_antonym',
+        'show_similar_to',
+        'show_entailment',
+        'show_cause',
+        'show_attribute',
+        'show_also_see',
+        'show_verb_group',
+        'show_participle_of_verb',
+        'show_derivationally_related_form',
+        'show_pertainym',
+        'show_derived_from',
+        'show_domain_of_synset_topic',
+        'show_member_of_domain_topic',
+        'show_domain_of_synset_region',
+        'show_member_of_domain_region',
+        'show_domain_of_synset_usage',
+        'show_member_of_domain_usage',
+    )
+    __slots__ = _FIELDS + ('_frozen',)
     
     def __init__(self, **kwargs):
         # Legacy compatibility
@@ -109,6 +149,35 @@ class RelationshipConfig:
         self.show_member_of_domain_region = kwargs.get('show_member_of_domain_region', False)
         self.show_domain_of_synset_usage = kwargs.get('show_domain_of_synset_usage', False)
         self.show_member_of_domain_usage = kwargs.get('show_member_of_domain_usage', False)
+        
+        self._frozen = True
+    
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__setattr__(self, name, value)
+    
+    def __delattr__(self, name):
+        if getattr(self, '_frozen', False):
+            raise AttributeError(f"{type(self).__name__} is immutable")
+        object.__delattr__(self, name)
+    
+    def _key(self) -> Tuple[bool, ...]:
+        return tuple(getattr(self, name) for name in self._FIELDS)
+    
+    def __eq__(self, other):
+        if not isinstance(other, RelationshipConfig):
+            return NotImplemented
+        return self._key() == other._key()
+    
+    def __hash__(self):
+        return hash(self._key())
+    
+    def __copy__(self):
+        return self
+    
+    def __deepcopy__(self, memo):
+        return self
 
 
 def get_relationships(synset, config: RelationshipConfig) -> Dict[RelationshipType, List]:
@@ -256,6 +325,61 @@ def get_relationships(synset, config: RelationshipConfig) -> Dict[RelationshipTy
     return relationships
 
 
+# Edge colors for each relationship type (shared by every edge built)
+_RELATIONSHIP_COLORS = {
+    # Basic connection - neutral grey
+    RelationshipType.SENSE: '#666666',  # Medium grey
+    
+    # TAXONOMIC RELATIONS - Red family (warm, hierarchical feeling)
+    RelationshipType.HYPERNYM: '#DC143C',          # Crimson (primary taxonomic)
+    RelationshipType.HYPONYM: '#B22222',           # Fire brick (slightly darker red)
+    RelationshipType.INSTANCE_HYPERNYM: '#FF6347', # Tomato (lighter, more orange-red)
+    RelationshipType.INSTANCE_HYPONYM: '#CD5C5C',  # Indian red (muted red)
+    
+    # PART-WHOLE RELATIONS - Green family (natural, structural feeling)
+    # Holonyms (whole → part) - darker greens
+    RelationshipType.MEMBER_HOLONYM: '#228B22',     # Forest green (member holonym)
+    RelationshipType.SUBSTANCE_HOLONYM: '#32CD32',  # Lime green (substance holonym)  
+    RelationshipType.PART_HOLONYM: '#006400',       # Dark green (part holonym)
+    # Meronyms (part → whole) - lighter greens
+    RelationshipType.MEMBER_MERONYM: '#90EE90',     # Light green (member meronym)
+    RelationshipType.SUBSTANCE_MERONYM: '#98FB98',  # Pale green (substance meronym)
+    RelationshipType.PART_MERONYM: '#00FF7F',       # Spring green (part meronym)
+    
+    # OPPOSITION & SIMILARITY - Purple family (contrasting, complementary feeling)
+    RelationshipType.ANTONYM: '#8A2BE2',     # Blue violet (strong opposition)
+    RelationshipType.SIMILAR_TO: '#DA70D6', # Orchid (similar but distinct)
+    
+    # CAUSATION & ENTAILMENT - Orange family (dynamic, action-oriented)
+    RelationshipType.ENTAILMENT: '#FF8C00', # Dark orange (logical entailment)
+    RelationshipType.CAUSE: '#FF4500',      # Orange red (direct causation)
+    
+    # CROSS-REFERENCE & ATTRIBUTES - Blue family (informational, linking)
+    RelationshipType.ATTRIBUTE: '#4169E1',  # Royal blue (attributes)
+    RelationshipType.ALSO_SEE: '#6495ED',   # Cornflower blue (see also)
+    
+    # VERB-SPECIFIC RELATIONS - Dark Green family (action-oriented)
+    RelationshipType.VERB_GROUP: '#2F4F4F',         # Dark slate grey (verb groups)
+    RelationshipType.PARTICIPLE_OF_VERB: '#708090', # Slate grey (participles)
+    
+    # MORPHOLOGICAL & DERIVATIONAL - Pink family (linguistic transformation)
+    RelationshipType.DERIVATIONALLY_RELATED_FORM: '#FF1493', # Deep pink (derivational)
+    RelationshipType.PERTAINYM: '#FF69B4',                  # Hot pink (pertainyms)
+    RelationshipType.DERIVED_FROM: '#FFB6C1',               # Light pink (derived from)
+    
+    # DOMAIN LABELS - Grey family (categorical, organizational)
+    # Topic domains - blue-greys
+    RelationshipType.DOMAIN_OF_SYNSET_TOPIC: '#708090',     # Slate grey
+    RelationshipType.MEMBER_OF_DOMAIN_TOPIC: '#778899',     # Light slate grey
+    # Region domains - neutral greys  
+    RelationshipType.DOMAIN_OF_SYNSET_REGION: '#696969',    # Dim grey
+    RelationshipType.MEMBER_OF_DOMAIN_REGION: '#808080',    # Grey
+    # Usage domains - lighter greys
+    RelationshipType.DOMAIN_OF_SYNSET_USAGE: '#A9A9A9',     # Dark grey
+    RelationshipType.MEMBER_OF_DOMAIN_USAGE: '#C0C0C0',     # Silver
+}
+
+
 def get_relationship_color(relationship_type: RelationshipType) -> str:
     """Get the color code for a relationship type.
     
@@ -269,105 +393,54 @@ def get_relationship_color(relationship_type: RelationshipType) -> str:
     - Morphological: Pink family
     - Domain: Grey family
     """
-    color_map = {
-        # Basic connection - neutral grey
-        RelationshipType.SENSE: '#666666',  # Medium grey
-        
-        # TAXONOMIC RELATIONS - Red family (warm, hierarchical feeling)
-        RelationshipType.HYPERNYM: '#DC143C',          # Crimson (primary taxonomic)
-        RelationshipType.HYPONYM: '#B22222',           # Fire brick (slightly darker red)
-        RelationshipType.INSTANCE_HYPERNYM: '#FF6347', # Tomato (lighter, more orange-red)
-        RelationshipType.INSTANCE_HYPONYM: '#CD5C5C',  # Indian red (muted red)
-        
-        # PART-WHOLE RELATIONS - Green family (natural, structural feeling)
-        # Holonyms (whole → part) - darker greens
-        RelationshipType.MEMBER_HOLONYM: '#228B22',     # Forest green (member holonym)
-        RelationshipType.SUBSTANCE_HOLONYM: '#32CD32',  # Lime green (substance holonym)  
-        RelationshipType.PART_HOLONYM: '#006400',       # Dark green (part holonym)
-        # Meronyms (part → whole) - lighter greens
-        RelationshipType.MEMBER_MERONYM: '#90EE90',     # Light green (member meronym)
-        RelationshipType.SUBSTANCE_MERONYM: '#98FB98',  # Pale green (substance meronym)
-        RelationshipType.PART_MERONYM: '#00FF7F',       # Spring green (part meronym)
-        
-        # OPPOSITION & SIMILARITY - Purple family (contrasting, complementary feeling)
-        RelationshipType.ANTONYM: '#8A2BE2',     # Blue violet (strong opposition)
-        RelationshipType.SIMILAR_TO: '#DA70D6', # Orchid (similar but distinct)
-        
-        # CAUSATION & ENTAILMENT - Orange family (dynamic, action-oriented)
-        RelationshipType.ENTAILMENT: '#FF8C00', # Dark orange (logical entailment)
-        RelationshipType.CAUSE: '#FF4500',      # Orange red (direct causation)
-        
-        # CROSS-REFERENCE & ATTRIBUTES - Blue family (informational, linking)
-        RelationshipType.ATTRIBUTE: '#4169E1',  # Royal blue (attributes)
-        RelationshipType.ALSO_SEE: '#6495ED',   # Cornflower blue (see also)
-        
-        # VERB-SPECIFIC RELATIONS - Dark Green family (action-oriented)
-        RelationshipType.VERB_GROUP: '#2F4F4F',         # Dark slate grey (verb groups)
-        RelationshipType.PARTICIPLE_OF_VERB: '#708090', # Slate grey (participles)
-        
-        # MORPHOLOGICAL & DERIVATIONAL - Pink family (linguistic transformation)
-        RelationshipType.DERIVATIONALLY_RELATED_FORM: '#FF1493', # Deep pink (derivational)
-        RelationshipType.PERTAINYM: '#FF69B4',                  # Hot pink (pertainyms)
-        RelationshipType.DERIVED_FROM: '#FFB6C1',               # Light pink (derived from)
-        
-        # DOMAIN LABELS - Grey family (categorical, organizational)
-        # Topic domains - blue-greys
-        RelationshipType.DOMAIN_OF_SYNSET_TOPIC: '#708090',     # Slate grey
-        RelationshipType.MEMBER_OF_DOMAIN_TOPIC: '#778899',     # Light slate grey
-        # Region domains - neutral greys  
-        RelationshipType.DOMAIN_OF_SYNSET_REGION: '#696969',    # Dim grey
-        RelationshipType.MEMBER_OF_DOMAIN_REGION: '#808080',    # Grey
-        # Usage domains - lighter greys
-        RelationshipType.DOMAIN_OF_SYNSET_USAGE: '#A9A9A9',     # Dark grey
-        RelationshipType.MEMBER_OF_DOMAIN_USAGE: '#C0C0C0',     # Silver
-    }
-    return color_map.get(relationship_type, '#000000')
+    return _RELATIONSHIP_COLORS.get(relationship_type, '#000000')
+
+
+# Arrow directions for each relationship type (shared by every edge built)
+_ARROW_DIRECTIONS = {
+    # Basic - no specific direction
+    RelationshipType.SENSE: 'to',
+    
+    # Taxonomic Relations - hypernyms point up (to more general), hyponyms point down (to more specific)
+    RelationshipType.HYPERNYM: 'to',  # points from specific to general
+    RelationshipType.HYPONYM: 'from',  # points from general to specific (reverse direction)
+    RelationshipType.INSTANCE_HYPERNYM: 'to',
+    RelationshipType.INSTANCE_HYPONYM: 'from',
+    
+    # Part-Whole Relations - meronyms point up (to whole), holonyms point down (to parts)
+    RelationshipType.MEMBER_HOLONYM: 'from',  # points from part to whole (reverse direction)
+    RelationshipType.SUBSTANCE_HOLONYM: 'from',
+    RelationshipType.PART_HOLONYM: 'from',
+    RelationshipType.MEMBER_MERONYM: 'to',  # points from whole to part
+    RelationshipType.SUBSTANCE_MERONYM: 'to',
+    RelationshipType.PART_MERONYM: 'to',
+    
+    # Default direction for all others
+    RelationshipType.ANTONYM: 'to',
+    RelationshipType.SIMILAR_TO: 'to',
+    RelationshipType.ENTAILMENT: 'to',
+    RelationshipType.CAUSE: 'to',
+    RelationshipType.ATTRIBUTE: 'to',
+    RelationshipType.ALSO_SEE: 'to',
+    RelationshipType.VERB_GROUP: 'to',
+    RelationshipType.PARTICIPLE_OF_VERB: 'to',
+    RelationshipType.DERIVATIONALLY_RELATED_FORM: 'to',
+    RelationshipType.PERTAINYM: 'to',
+    RelationshipType.DERIVED_FROM: 'to',
+    RelationshipType.DOMAIN_OF_SYNSET_TOPIC: 'to',
+    RelationshipType.MEMBER_OF_DOMAIN_TOPIC: 'to',
+    RelationshipType.DOMAIN_OF_SYNSET_REGION: 'to',
+    RelationshipType.MEMBER_OF_DOMAIN_REGION: 'to',
+    RelationshipType.DOMAIN_OF_SYNSET_USAGE: 'to',
+    RelationshipType.MEMBER_OF_DOMAIN_USAGE: 'to',
+}
 
 
 def get_relationship_properties(relationship_type: RelationshipType) -> Dict[str, Any]:
     """Get display properties for a relationship type."""
-    # Define arrow directions for different relationship types
-    arrow_direction_map = {
-        # Basic - no specific direction
-        RelationshipType.SENSE: 'to',
-        
-        # Taxonomic Relations - hypernyms point up (to more general), hyponyms point down (to more specific)
-        RelationshipType.HYPERNYM: 'to',  # points from specific to general
-        RelationshipType.HYPONYM: 'from',  # points from general to specific (reverse direction)
-        RelationshipType.INSTANCE_HYPERNYM: 'to',
-        RelationshipType.INSTANCE_HYPONYM: 'from',
-        
-        # Part-Whole Relations - meronyms point up (to whole), holonyms point down (to parts)
-        RelationshipType.MEMBER_HOLONYM: 'from',  # points from part to whole (reverse direction)
-        RelationshipType.SUBSTANCE_HOLONYM: 'from',
-        RelationshipType.PART_HOLONYM: 'from',
-        RelationshipType.MEMBER_MERONYM: 'to',  # points from whole to part
-        RelationshipType.SUBSTANCE_MERONYM: 'to',
-        RelationshipType.PART_MERONYM: 'to',
-        
-        # Default direction for all others
-        RelationshipType.ANTONYM: 'to',
-        RelationshipType.SIMILAR_TO: 'to',
-        RelationshipType.ENTAILMENT: 'to',
-        RelationshipType.CAUSE: 'to',
-        RelationshipType.ATTRIBUTE: 'to',
-        RelationshipType.ALSO_SEE: 'to',
-        RelationshipType.VERB_GROUP: 'to',
-        RelationshipType.PARTICIPLE_OF_VERB: 'to',
-        RelationshipType.DERIVATIONALLY_RELATED_FORM: 'to',
-        RelationshipType.PERTAINYM: 'to',
-        RelationshipType.DERIVED_FROM: 'to',
-        RelationshipType.DOMAIN_OF_SYNSET_TOPIC: 'to',
-        RelationshipType.MEMBER_OF_DOMAIN_TOPIC: 'to',
-        RelationshipType.DOMAIN_OF_SYNSET_REGION: 'to',
-        RelationshipType.MEMBER_OF_DOMAIN_REGION: 'to',
-        RelationshipType.DOMAIN_OF_SYNSET_USAGE: 'to',
-        RelationshipType.MEMBER_OF_DOMAIN_USAGE: 'to',
-    }
-    
     return {
         'color': get_relationship_color(relationship_type),
-        'arrow_direction': arrow_direction_map.get(relationship_type, 'to'),
+        'arrow_direction': _ARROW_DIRECTIONS.get(relationship_type, 'to'),
         'relation': relationship_type.value
     }
 
@@ -2,14 +2,16 @@
 Pytest configuration and common fixtures for WordNet Explorer tests.
 """
 
+import functools
 import pytest
+import networkx as nx
 import sys
 import os
+import weakref
 
-# Add src directory to Python path
+# Add the project root to Python path so the src package is importable
 current_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-src_dir = os.path.join(current_dir, 'src')
-if src_dir not in sys.path:
+if current_dir not in sys.path:
     sys.path.insert(0, current_dir)
 
 from src.core import WordNetExplorer
@@ -22,6 +24,24 @@ def explorer():
     return WordNetExplorer()
 
 
+@pytest.fixture(scope="session")
+def explore_cached(explorer):
+    """Memoized explorer.explore_word, so identical graphs are built once per session.
+    
+    Cached graphs are frozen so that one test cannot alter what the next one sees.
+    """
+    cache = {}
+    
+    def explore(word, **kwargs):
+        key = (word, tuple(sorted(kwargs.items())))
+        if key not in cache:
+            G, node_labels = explorer.explore_word(word, **kwargs)
+            cache[key] = (nx.freeze(G), node_labels)
+        return cache[key]
+    
+    return explore
+
+
 @pytest.fixture(scope="session")
 def relationship_config_all():
     """Relationship config with all relationships enabled."""
@@ -54,22 +74,37 @@ def relationship_config_taxonomic():
     )
 
 
+@functools.lru_cache(maxsize=4096)
 def extract_node_name(node_id):
     """Extract clean node name from node ID."""
-    if '.' in node_id:
-        return node_id.split('.')[0]
-    elif '_' in node_id:
-        return node_id.split('_')[-1]
-    return node_id
+    head, sep, _ = node_id.partition('.')
+    if sep:
+        return head
+    # rpartition yields the whole ID when there is no underscore
+    return node_id.rpartition('_')[2]
+
+
+def build_node_name_cache(G):
+    """Map every node ID in G to its clean name, for repeated edge analysis."""
+    return {node: extract_node_name(node) for node in G.nodes}
 
 
-def analyze_arrow_direction(source, target, edge_data):
-    """Analyze arrow direction for taxonomic relationships."""
+def analyze_arrow_direction(source, target, edge_data, name_cache=None):
+    """Analyze arrow direction for taxonomic relationships.
+    
+    Returns a dict with the edge's relation, original_edge, visual_arrow and
+    arrow_direction, its visual_source and visual_target names, and the same two
+    names lower-cased as visual_source_lower and visual_target_lower.
+    """
     relation = edge_data.get('relation', 'unknown')
     arrow_direction = edge_data.get('arrow_direction', 'to')
     
-    source_name = extract_node_name(source)
-    target_name = extract_node_name(target)
+    if name_cache is not None:
+        source_name = name_cache[source]
+        target_name = name_cache[target]
+    else:
+        source_name = extract_node_name(source)
+        target_name = extract_node_name(target)
     
     # Determine visual arrow based on the current logic
     if relation == 'hypernym':
@@ -91,5 +126,30 @@ def analyze_arrow_direction(source, target, edge_data):
         'visual_arrow': f"{visual_source} → {visual_target}",
         'arrow_direction': arrow_direction,
         'visual_source': visual_source,
-        'visual_target': visual_target
-    } 
\ No newline at end of file
+        'visual_target': visual_target,
+        'visual_source_lower': visual_source.lower(),
+        'visual_target_lower': visual_target.lower()
+    } 
+
+
+# Arrow analyses of frozen graphs, dropped once a graph is garbage collected
+_ARROW_ANALYSES = weakref.WeakKeyDictionary()
+
+
+def analyze_all_edges(G):
+    """Arrow analysis for every edge of G.
+    
+    Results are cached only for frozen graphs, such as those from explore_cached,
+    since their edges cannot change; any other graph is analyzed afresh each call.
+    """
+    if nx.is_frozen(G):
+        analyses = _ARROW_ANALYSES.get(G)
+        if analyses is not None:
+            return analyses
+    
+    node_names = build_node_name_cache(G)
+    analyses = [analyze_arrow_direction(source, target, edge_data, node_names)
+                for source, target, edge_data in G.edges(data=True)]
+    if nx.is_frozen(G):
+        _ARROW_ANALYSES[G] = analyses
+    return analyses
@@ -2,8 +2,93 @@
 Test suite for arrow direction consistency in WordNet Explorer.
 """
 
+from collections import Counter
+
 import pytest
-from tests.conftest import analyze_arrow_direction
+from tests.conftest import analyze_all_edges, analyze_arrow_direction, build_node_name_cache
+
+
+_TAXONOMIC_RELATIONS = frozenset({'hypernym', 'hyponym'})
+
+# (abstract, specific) pairs whose arrow pointing abstract → specific is an obvious error
+_ABSTRACT_TO_SPECIFIC_PATTERNS = [
+    ('entity', ['dog', 'cat', 'car', 'table']),
+    ('abstraction', ['measure', 'time_unit', 'emotion']),
+    ('measure', ['second', 'minute', 'hour']),
+    ('animal', ['dog', 'cat', 'bird']),
+    ('vehicle', ['car', 'truck', 'bus']),
+    ('furniture', ['chair', 'table', 'bed']),
+    ('emotion', ['happiness', 'sadness', 'anger'])
+]
+_ABSTRACT_TO_SPECIFIC = frozenset(
+    (abstract_term, specific_term)
+    for abstract_term, specific_terms in _ABSTRACT_TO_SPECIFIC_PATTERNS
+    for specific_term in specific_terms
+)
+
+_DOMAINS = {
+    'animals': ['dog', 'cat', 'bird', 'mammal', 'vertebrate'],
+    'objects': ['car', 'vehicle', 'chair', 'furniture', 'table'],
+    'time': ['second', 'minute', 'hour', 'day', 'week', 'femtosecond', 'picosecond'],
+    'emotions': ['emotion', 'happiness', 'sadness', 'feeling'],
+    'actions': ['run', 'walk', 'move', 'travel'],
+    'properties': ['big', 'large', 'huge', 'small', 'tiny']
+}
+# Reverse index; built from the last domain back so the first domain listing a word wins
+_WORD_TO_DOMAIN = {
+    word: domain
+    for domain, words in reversed(_DOMAINS.items())
+    for word in words
+}
+
+
+# Time-unit hierarchy levels (higher number = more specific)
+_HIERARCHY_LEVELS = {
+    'entity': 1,
+    'abstraction': 2,
+    'measure': 3,
+    'time_unit': 4,
+    'femtosecond': 5, 'picosecond': 5, 'nanosecond': 5,
+    'microsecond': 5, 'millisecond': 5, 'second': 5,
+    'minute': 5, 'hour': 5, 'day': 5, 'week': 5
+}
+
+# Abstraction levels (higher = more abstract)
+_ABSTRACTION_LEVELS = {
+    # Most concrete
+    'femtosecond': 1, 'picosecond': 1, 'nanosecond': 1, 'microsecond': 1,
+    'millisecond': 1, 'second': 1, 'minute': 1, 'hour': 1, 'day': 1,
+    'dog': 1, 'cat': 1, 'bird': 1, 'car': 1, 'chair': 1, 'table': 1,
+    'happiness': 1, 'sadness': 1,
+
+    # Intermediate
+    'canine': 2, 'feline': 2, 'mammal': 2, 'vehicle': 2, 'furniture': 2,
+    'time_unit': 2, 'emotion': 2,
+
+    # More abstract
+    'vertebrate': 3, 'animal': 3, 'organism': 3, 'artifact': 3,
+    'measure': 3, 'feeling': 3,
+
+    # Very abstract
+    'living_thing': 4, 'whole': 4, 'object': 4, 'quantity': 4,
+    'abstraction': 5, 'entity': 6
+}
+
+
+# Color family of each relation; any other relation naming a domain is 'domain'
+_COLOR_FAMILY_OF_RELATION = {
+    'hypernym': 'taxonomic', 'hyponym': 'taxonomic',
+    'instance_hypernym': 'taxonomic', 'instance_hyponym': 'taxonomic',
+    'member_holonym': 'part_whole', 'substance_holonym': 'part_whole', 'part_holonym': 'part_whole',
+    'member_meronym': 'part_whole', 'substance_meronym': 'part_whole', 'part_meronym': 'part_whole',
+    'antonym': 'opposition', 'similar_to': 'opposition',
+    'entailment': 'causation', 'cause': 'causation',
+    'attribute': 'cross_reference', 'also_see': 'cross_reference',
+    'verb_group': 'verb_specific', 'participle_of_verb': 'verb_specific',
+    'derivationally_related_form': 'morphological', 'pertainym': 'morphological',
+    'derived_from': 'morphological',
+    'sense': 'basic'
+}
 
 
 class TestArrowConsistency:
@@ -16,11 +101,11 @@ class TestArrowConsistency:
         print("✅ WordNet Explorer initialized successfully")
     
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_wordnet_explorer_setup"])
-    def test_femtosecond_relationships(self, explorer, relationship_config_all):
+    def test_femtosecond_relationships(self, explore_cached, relationship_config_all):
         """Test taxonomic relationships for femtosecond."""
         print("\n🔍 Testing femtosecond taxonomic relationships...")
         
-        G, node_labels = explorer.explore_word(
+        G, node_labels = explore_cached(
             'femtosecond', 
             depth=3, 
             max_nodes=100,
@@ -33,12 +118,15 @@ class TestArrowConsistency:
         
         # Collect taxonomic relationships
         taxonomic_edges = []
-        for source, target, edge_data in G.edges(data=True):
-            relation = edge_data.get('relation', 'unknown')
-            if relation in ['hypernym', 'hyponym']:
-                arrow_info = analyze_arrow_direction(source, target, edge_data)
+        edge_lines = []
+        for arrow_info in analyze_all_edges(G):
+            relation = arrow_info['relation']
+            if relation in _TAXONOMIC_RELATIONS:
                 taxonomic_edges.append(arrow_info)
-                print(f"  {relation.upper()}: {arrow_info['visual_arrow']}")
+                edge_lines.append(f"  {relation.upper()}: {arrow_info['visual_arrow']}")
+        
+        if edge_lines:
+            print('\n'.join(edge_lines))
         
         assert len(taxonomic_edges) > 0, "Should find taxonomic relationships for femtosecond"
         
@@ -47,7 +135,7 @@ class TestArrowConsistency:
         print(f"✅ Found {len(taxonomic_edges)} taxonomic relationships for femtosecond")
     
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_femtosecond_relationships"])
-    def test_time_hierarchy_consistency(self, explorer):
+    def test_time_hierarchy_consistency(self, explore_cached):
         """Test consistency of time unit hierarchy relationships."""
         print("\n🔍 Testing time unit hierarchy consistency...")
         
@@ -57,7 +145,7 @@ class TestArrowConsistency:
         for word in time_words:
             print(f"\n  Testing '{word}'...")
             
-            G, _ = explorer.explore_word(
+            G, _ = explore_cached(
                 word, 
                 depth=2, 
                 max_nodes=50,
@@ -66,41 +154,33 @@ class TestArrowConsistency:
             )
             
             word_edges = []
-            for source, target, edge_data in G.edges(data=True):
-                relation = edge_data.get('relation', 'unknown')
-                if relation in ['hypernym', 'hyponym']:
-                    arrow_info = analyze_arrow_direction(source, target, edge_data)
+            edge_lines = []
+            for arrow_info in analyze_all_edges(G):
+                relation = arrow_info['relation']
+                if relation in _TAXONOMIC_RELATIONS:
                     word_edges.append(arrow_info)
                     all_taxonomic_edges.append(arrow_info)
-                    print(f"    {relation.upper()}: {arrow_info['visual_arrow']}")
+                    edge_lines.append(f"    {relation.upper()}: {arrow_info['visual_arrow']}")
             
+            if edge_lines:
+                print('\n'.join(edge_lines))
             print(f"    Found {len(word_edges)} taxonomic relationships")
         
         # Analyze consistency
         print(f"\n📊 Analyzing {len(all_taxonomic_edges)} total taxonomic relationships...")
         
-        # Define hierarchy levels (higher number = more specific)
-        hierarchy_levels = {
-            'entity': 1,
-            'abstraction': 2,
-            'measure': 3,
-            'time_unit': 4,
-            'femtosecond': 5, 'picosecond': 5, 'nanosecond': 5,
-            'microsecond': 5, 'millisecond': 5, 'second': 5,
-            'minute': 5, 'hour': 5, 'day': 5, 'week': 5
-        }
-        
         specific_to_general = 0
         general_to_specific = 0
         unclear = 0
         
+        levels = _HIERARCHY_LEVELS.get
         for edge in all_taxonomic_edges:
-            source_level = hierarchy_levels.get(edge['visual_source'].lower(), 0)
-            target_level = hierarchy_levels.get(edge['visual_target'].lower(), 0)
+            source_level = levels(edge['visual_source_lower'], 0)
+            target_level = levels(edge['visual_target_lower'], 0)
             
-            if source_level > target_level and source_level > 0 and target_level > 0:
+            if source_level > target_level > 0:
                 specific_to_general += 1
-            elif target_level > source_level and source_level > 0 and target_level > 0:
+            elif target_level > source_level > 0:
                 general_to_specific += 1
             else:
                 unclear += 1
@@ -117,7 +197,7 @@ class TestArrowConsistency:
         print("✅ Taxonomic arrow consistency verified")
     
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_time_hierarchy_consistency"])
-    def test_comprehensive_specific_to_abstract_arrows(self, explorer):
+    def test_comprehensive_specific_to_abstract_arrows(self, explore_cached):
         """Comprehensive test to ensure ALL taxonomic arrows go from specific to abstract across all relevant categories."""
         print("\n🔍 COMPREHENSIVE TEST: All taxonomic arrows specific → abstract...")
         
@@ -145,7 +225,7 @@ class TestArrowConsistency:
             print(f"\n  🔍 Testing '{word}'...")
             
             try:
-                G, _ = explorer.explore_word(
+                G, _ = explore_cached(
                     word, 
                     depth=2, 
                     max_nodes=30,
@@ -154,10 +234,10 @@ class TestArrowConsistency:
                 )
                 
                 word_relationships = []
-                for source, target, edge_data in G.edges(data=True):
-                    relation = edge_data.get('relation', 'unknown')
-                    if relation in ['hypernym', 'hyponym']:
-                        arrow_info = analyze_arrow_direction(source, target, edge_data)
+                word_violations = 0
+                for arrow_info in analyze_all_edges(G):
+                    relation = arrow_info['relation']
+                    if relation in _TAXONOMIC_RELATIONS:
                         word_relationships.append(arrow_info)
                         all_taxonomic_relationships.append(arrow_info)
                         
@@ -169,6 +249,7 @@ class TestArrowConsistency:
                                 'arrow_info': arrow_info,
                                 'violation_reason': violation
                             })
+                            word_violations += 1
                         
                         print(f"    {relation.upper()}: {arrow_info['visual_arrow']}")
                 
@@ -177,7 +258,7 @@ class TestArrowConsistency:
                 if domain not in domain_stats:
                     domain_stats[domain] = {'total': 0, 'violations': 0}
                 domain_stats[domain]['total'] += len(word_relationships)
-                domain_stats[domain]['violations'] += len([v for v in all_violations if v['word'] == word])
+                domain_stats[domain]['violations'] += word_violations
                 
                 print(f"    Found {len(word_relationships)} taxonomic relationships")
                 
@@ -225,84 +306,32 @@ class TestArrowConsistency:
     
     def _check_specific_to_abstract_violation(self, arrow_info):
         """Check if an arrow violates the specific → abstract rule."""
-        source = arrow_info['visual_source'].lower()
-        target = arrow_info['visual_target'].lower()
-        
-        # Define abstraction levels (higher = more abstract)
-        abstraction_levels = {
-            # Most concrete
-            'femtosecond': 1, 'picosecond': 1, 'nanosecond': 1, 'microsecond': 1,
-            'millisecond': 1, 'second': 1, 'minute': 1, 'hour': 1, 'day': 1,
-            'dog': 1, 'cat': 1, 'bird': 1, 'car': 1, 'chair': 1, 'table': 1,
-            'happiness': 1, 'sadness': 1,
-            
-            # Intermediate
-            'canine': 2, 'feline': 2, 'mammal': 2, 'vehicle': 2, 'furniture': 2,
-            'time_unit': 2, 'emotion': 2,
-            
-            # More abstract
-            'vertebrate': 3, 'animal': 3, 'organism': 3, 'artifact': 3,
-            'measure': 3, 'feeling': 3,
-            
-            # Very abstract
-            'living_thing': 4, 'whole': 4, 'object': 4, 'quantity': 4,
-            'abstraction': 5, 'entity': 6
-        }
+        source = arrow_info['visual_source_lower']
+        target = arrow_info['visual_target_lower']
         
-        source_level = abstraction_levels.get(source, 0)
-        target_level = abstraction_levels.get(target, 0)
+        source_level = _ABSTRACTION_LEVELS.get(source, 0)
+        target_level = _ABSTRACTION_LEVELS.get(target, 0)
         
         # If we can determine levels and source is more abstract than target, it's a violation
-        if source_level > 0 and target_level > 0 and source_level > target_level:
+        if source_level > target_level > 0:
             return f"Abstract ({source}, level {source_level}) → Specific ({target}, level {target_level})"
         
         # Check for obvious violations based on common knowledge
-        if self._is_obvious_abstract_to_specific(source, target):
+        if (source, target) in _ABSTRACT_TO_SPECIFIC:
             return f"Obvious violation: {source} is more abstract than {target}"
         
         return None
     
-    def _is_obvious_abstract_to_specific(self, source, target):
-        """Check for obvious abstract → specific violations."""
-        abstract_to_specific_patterns = [
-            ('entity', ['dog', 'cat', 'car', 'table']),
-            ('abstraction', ['measure', 'time_unit', 'emotion']),
-            ('measure', ['second', 'minute', 'hour']),
-            ('animal', ['dog', 'cat', 'bird']),
-            ('vehicle', ['car', 'truck', 'bus']),
-            ('furniture', ['chair', 'table', 'bed']),
-            ('emotion', ['happiness', 'sadness', 'anger'])
-        ]
-        
-        for abstract_term, specific_terms in abstract_to_specific_patterns:
-            if source == abstract_term and target in specific_terms:
-                return True
-        
-        return False
-    
     def _categorize_word_domain(self, word):
         """Categorize a word into a semantic domain."""
-        domains = {
-            'animals': ['dog', 'cat', 'bird', 'mammal', 'vertebrate'],
-            'objects': ['car', 'vehicle', 'chair', 'furniture', 'table'],
-            'time': ['second', 'minute', 'hour', 'day', 'week', 'femtosecond', 'picosecond'],
-            'emotions': ['emotion', 'happiness', 'sadness', 'feeling'],
-            'actions': ['run', 'walk', 'move', 'travel'],
-            'properties': ['big', 'large', 'huge', 'small', 'tiny']
-        }
-        
-        for domain, words in domains.items():
-            if word in words:
-                return domain
-        
-        return 'other'
+        return _WORD_TO_DOMAIN.get(word, 'other')
 
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_comprehensive_specific_to_abstract_arrows"])
-    def test_tooltip_accuracy(self, explorer):
+    def test_tooltip_accuracy(self, explore_cached):
         """Test that tooltips accurately describe the visual arrows."""
         print("\n🔍 Testing tooltip accuracy...")
         
-        G, _ = explorer.explore_word(
+        G, _ = explore_cached(
             'femtosecond', 
             depth=2, 
             max_nodes=50,
@@ -311,11 +340,10 @@ class TestArrowConsistency:
         )
         
         tooltip_tests = []
-        for source, target, edge_data in G.edges(data=True):
-            relation = edge_data.get('relation', 'unknown')
-            if relation in ['hypernym', 'hyponym']:
-                arrow_info = analyze_arrow_direction(source, target, edge_data)
-                
+        tooltip_lines = []
+        for arrow_info in analyze_all_edges(G):
+            relation = arrow_info['relation']
+            if relation in _TAXONOMIC_RELATIONS:
                 # Generate expected tooltip based on visual arrow
                 expected_tooltip = f"Is-a relationship: {arrow_info['visual_source']} is a type of {arrow_info['visual_target']}"
                 
@@ -325,7 +353,10 @@ class TestArrowConsistency:
                     'relation': relation
                 })
                 
-                print(f"  {arrow_info['visual_arrow']} → \"{expected_tooltip}\"")
+                tooltip_lines.append(f"  {arrow_info['visual_arrow']} → \"{expected_tooltip}\"")
+        
+        if tooltip_lines:
+            print('\n'.join(tooltip_lines))
         
         assert len(tooltip_tests) > 0, "Should find tooltips to test"
         
@@ -336,11 +367,11 @@ class TestArrowConsistency:
         print(f"✅ Verified {len(tooltip_tests)} tooltip patterns")
     
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_tooltip_accuracy"])
-    def test_edge_duplication_prevention(self, explorer):
+    def test_edge_duplication_prevention(self, explore_cached):
         """Test that edge duplication is properly prevented."""
         print("\n🔍 Testing edge duplication prevention...")
         
-        G, _ = explorer.explore_word(
+        G, _ = explore_cached(
             'femtosecond', 
             depth=3, 
             max_nodes=100,
@@ -348,31 +379,25 @@ class TestArrowConsistency:
             show_hyponyms=True
         )
         
-        # Check for duplicate edges
-        edge_count = {}
-        duplicate_edges = []
+        # Check for duplicate edges; only the endpoints matter, so skip edge data
+        edges = list(G.edges())
+        unique_edges = set(edges)
         
-        for source, target, edge_data in G.edges(data=True):
-            edge_key = (source, target)
-            if edge_key in edge_count:
-                edge_count[edge_key] += 1
-                duplicate_edges.append(edge_key)
-            else:
-                edge_count[edge_key] = 1
-        
-        print(f"  Total edges: {G.number_of_edges()}")
-        print(f"  Unique edge pairs: {len(edge_count)}")
-        print(f"  Duplicate edges: {len(duplicate_edges)}")
+        print(f"  Total edges: {len(edges)}")
+        print(f"  Unique edge pairs: {len(unique_edges)}")
+        print(f"  Duplicate edges: {len(edges) - len(unique_edges)}")
         
-        assert len(duplicate_edges) == 0, f"Found duplicate edges: {duplicate_edges}"
+        # Only tally the offending pairs when the assertion actually fails
+        assert len(edges) == len(unique_edges), \
+            f"Found duplicate edges: {[edge for edge, count in Counter(edges).items() if count > 1]}"
         print("✅ No duplicate edges found")
     
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_edge_duplication_prevention"])
-    def test_arrow_direction_property_handling(self, explorer):
+    def test_arrow_direction_property_handling(self, explore_cached):
         """Test that arrow_direction property is correctly handled."""
         print("\n🔍 Testing arrow_direction property handling...")
         
-        G, _ = explorer.explore_word(
+        G, _ = explore_cached(
             'femtosecond', 
             depth=2, 
             max_nodes=50,
@@ -380,24 +405,24 @@ class TestArrowConsistency:
             show_hyponyms=True
         )
         
-        arrow_directions = {'to': 0, 'from': 0, 'missing': 0}
+        arrow_directions = Counter()
         taxonomic_edges = []
+        edge_lines = []
         
-        for source, target, edge_data in G.edges(data=True):
-            relation = edge_data.get('relation', 'unknown')
-            if relation in ['hypernym', 'hyponym']:
+        node_names = build_node_name_cache(G)
+        # Pull only the relation per edge; fetch full edge data for taxonomic edges
+        for source, target, relation in G.edges(data='relation', default='unknown'):
+            if relation in _TAXONOMIC_RELATIONS:
+                edge_data = G[source][target]
                 arrow_direction = edge_data.get('arrow_direction')
-                if arrow_direction == 'to':
-                    arrow_directions['to'] += 1
-                elif arrow_direction == 'from':
-                    arrow_directions['from'] += 1
-                else:
-                    arrow_directions['missing'] += 1
+                arrow_directions[arrow_direction if arrow_direction in ('to', 'from') else 'missing'] += 1
                 
-                arrow_info = analyze_arrow_direction(source, target, edge_data)
+                arrow_info = analyze_arrow_direction(source, target, edge_data, node_names)
                 taxonomic_edges.append(arrow_info)
-                print(f"  {relation}: {arrow_info['original_edge']} (arrow_dir: {arrow_direction}) → Visual: {arrow_info['visual_arrow']}")
+                edge_lines.append(f"  {relation}: {arrow_info['original_edge']} (arrow_dir: {arrow_direction}) → Visual: {arrow_info['visual_arrow']}")
         
+        if edge_lines:
+            print('\n'.join(edge_lines))
         print(f"\n  Arrow direction distribution:")
         print(f"    'to': {arrow_directions['to']}")
         print(f"    'from': {arrow_directions['from']}")
@@ -408,7 +433,7 @@ class TestArrowConsistency:
         print("✅ Arrow direction property handling verified")
 
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_arrow_direction_property_handling"])
-    def test_enhanced_color_scheme(self, explorer):
+    def test_enhanced_color_scheme(self, explore_cached):
         """Test that the enhanced color scheme properly groups relationship families."""
         print("\n🔍 Testing enhanced color scheme...")
         
@@ -416,7 +441,7 @@ class TestArrowConsistency:
         from src.wordnet.relationships import get_relationship_color, RelationshipType
         
         # Test a word that will likely have multiple relationship types
-        G, _ = explorer.explore_word(
+        G, _ = explore_cached(
             'dog', 
             depth=2, 
             max_nodes=50,
@@ -450,25 +475,11 @@ class TestArrowConsistency:
                 relationship_colors[relation] = color
                 
             # Categorize into families
-            if relation in ['hypernym', 'hyponym', 'instance_hypernym', 'instance_hyponym']:
-                color_families['taxonomic'].add(color)
-            elif relation in ['member_holonym', 'substance_holonym', 'part_holonym', 
-                            'member_meronym', 'substance_meronym', 'part_meronym']:
-                color_families['part_whole'].add(color)
-            elif relation in ['antonym', 'similar_to']:
-                color_families['opposition'].add(color)
-            elif relation in ['entailment', 'cause']:
-                color_families['causation'].add(color)
-            elif relation in ['attribute', 'also_see']:
-                color_families['cross_reference'].add(color)
-            elif relation in ['verb_group', 'participle_of_verb']:
-                color_families['verb_specific'].add(color)
-            elif relation in ['derivationally_related_form', 'pertainym', 'derived_from']:
-                color_families['morphological'].add(color)
-            elif 'domain' in relation:
-                color_families['domain'].add(color)
-            elif relation == 'sense':
-                color_families['basic'].add(color)
+            family = _COLOR_FAMILY_OF_RELATION.get(relation)
+            if family is None and 'domain' in relation:
+                family = 'domain'
+            if family is not None:
+                color_families[family].add(color)
         
         print(f"\n  Relationships found: {list(relationship_colors.keys())}")
         print(f"  Colors by relationship:")
@@ -568,7 +579,7 @@ class TestSpecificCases:
     """Test specific edge cases and problematic relationships."""
     
     @pytest.mark.dependency(depends=["TestArrowConsistency::test_arrow_direction_property_handling"])
-    def test_quarter_hour_case(self, explorer):
+    def test_quarter_hour_case(self, explore_cached):
         """Test the specific quarter-hour case mentioned by the user."""
         print("\n🔍 Testing quarter-hour specific case...")
         
@@ -576,10 +587,11 @@ class TestSpecificCases:
         test_words = ['hour', 'minute', 'time']
         
         found_quarter_hour = False
+        validated_quarter_hour = False
         for word in test_words:
             print(f"\n  Testing '{word}' for quarter-hour connections...")
             
-            G, _ = explorer.explore_word(
+            G, _ = explore_cached(
                 word, 
                 depth=3, 
                 max_nodes=100,
@@ -587,15 +599,16 @@ class TestSpecificCases:
                 show_hyponyms=True
             )
             
-            for source, target, edge_data in G.edges(data=True):
-                source_name = source.split('.')[0] if '.' in source else source.split('_')[-1]
-                target_name = target.split('.')[0] if '.' in target else target.split('_')[-1]
-                
-                if 'quarter' in source_name.lower() or 'quarter' in target_name.lower():
+            node_names = build_node_name_cache(G)
+            quarter_nodes = {node for node, name in node_names.items() if 'quarter' in name.lower()}
+            if not quarter_nodes:
+                continue
+            
+            for source, target, relation in G.edges(data='relation', default='unknown'):
+                if source in quarter_nodes or target in quarter_nodes:
                     found_quarter_hour = True
-                    relation = edge_data.get('relation', 'unknown')
-                    if relation in ['hypernym', 'hyponym']:
-                        arrow_info = analyze_arrow_direction(source, target, edge_data)
+                    if relation in _TAXONOMIC_RELATIONS:
+                        arrow_info = analyze_arrow_direction(source, target, G[source][target], node_names)
                         print(f"    FOUND: {relation.upper()}: {arrow_info['visual_arrow']}")
                         
                         # Verify the relationship makes semantic sense
@@ -604,8 +617,14 @@ class TestSpecificCases:
                             # quarter-hour should be more specific than time_unit
                             if 'quarter' in arrow_info['visual_source'] and 'time_unit' in arrow_info['visual_target']:
                                 print(f"    ✅ Correct: quarter-hour → time_unit (specific → general)")
+                                validated_quarter_hour = True
+                                break
                             else:
                                 print(f"    ❌ Incorrect: {arrow_info['visual_arrow']}")
+            
+            # The case is settled once one correct quarter-hour edge is seen
+            if validated_quarter_hour:
+                break
         
         if not found_quarter_hour:
             print("  No quarter-hour relationships found in test words")
@@ -613,7 +632,7 @@ class TestSpecificCases:
         print("✅ Quarter-hour case analysis complete")
     
     @pytest.mark.dependency(depends=["TestSpecificCases::test_quarter_hour_case"])
-    def test_cross_pos_consistency(self, explorer):
+    def test_cross_pos_consistency(self, explore_cached):
         """Test arrow consistency across different parts of speech."""
         print("\n🔍 Testing cross-POS consistency...")
         
@@ -628,7 +647,7 @@ class TestSpecificCases:
         for word, pos in test_cases:
             print(f"\n  Testing '{word}' ({pos})...")
             
-            G, _ = explorer.explore_word(
+            G, _ = explore_cached(
                 word, 
                 depth=2, 
                 max_nodes=50,
@@ -637,14 +656,16 @@ class TestSpecificCases:
             )
             
             word_edges = []
-            for source, target, edge_data in G.edges(data=True):
-                relation = edge_data.get('relation', 'unknown')
-                if relation in ['hypernym', 'hyponym']:
-                    arrow_info = analyze_arrow_direction(source, target, edge_data)
+            edge_lines = []
+            for arrow_info in analyze_all_edges(G):
+                relation = arrow_info['relation']
+                if relation in _TAXONOMIC_RELATIONS:
                     word_edges.append(arrow_info)
                     all_edges.append(arrow_info)
-                    print(f"    {relation.upper()}: {arrow_info['visual_arrow']}")
+                    edge_lines.append(f"    {relation.upper()}: {arrow_info['visual_arrow']}")
             
+            if edge_lines:
+                print('\n'.join(edge_lines))
             print(f"    Found {len(word_edges)} taxonomic relationships")
         
         print(f"\n  Total taxonomic relationships across POS: {len(all_edges)}")
@@ -657,19 +678,17 @@ class TestSpecificCases:
 
 
 @pytest.mark.dependency(depends=["TestSpecificCases::test_cross_pos_consistency"])
-def test_overall_system_health(explorer):
+@pytest.mark.parametrize("word", ['test', 'example', 'simple', 'complex'])
+def test_overall_system_health(explorer, word):
     """Final test to verify overall system health."""
-    print("\n🔍 Testing overall system health...")
+    print(f"\n🔍 Testing overall system health for '{word}'...")
     
     # Test that the system can handle various inputs without crashing
-    test_words = ['test', 'example', 'simple', 'complex']
-    
-    for word in test_words:
-        try:
-            G, node_labels = explorer.explore_word(word, depth=1, max_nodes=20)
-            assert G.number_of_nodes() >= 0, f"Graph should be created for '{word}'"
-            print(f"  ✅ '{word}': {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
-        except Exception as e:
-            pytest.fail(f"System failed for word '{word}': {e}")
+    try:
+        G, node_labels = explorer.explore_word(word, depth=1, max_nodes=20)
+        assert G.number_of_nodes() >= 0, f"Graph should be created for '{word}'"
+        print(f"  ✅ '{word}': {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
+    except Exception as e:
+        pytest.fail(f"System failed for word '{word}': {e}")
     
     print("✅ Overall system health verified") 
\ No newline at end of file
@@ -11,10 +11,10 @@ class TestGraphBuilding:
     """Test core graph building functionality."""
     
     @pytest.mark.dependency()
-    def test_basic_graph_creation(self, explorer):
+    def test_basic_graph_creation(self, explore_cached):
         """Test basic graph creation for a simple word."""
         word = 'dog'
-        G, node_labels = explorer.explore_word(word, depth=1, max_nodes=20)
+        G, node_labels = explore_cached(word, depth=1, max_nodes=20)
         
         assert isinstance(G, nx.Graph), "Should return a NetworkX Graph"
         assert isinstance(node_labels, dict), "Should return node labels dictionary"
@@ -23,10 +23,10 @@ class TestGraphBuilding:
         print(f"✅ Basic graph created: {G.number_of_nodes()} nodes, {G.number_of_edges()} edges")
     
     @pytest.mark.dependency(depends=["TestGraphBuilding::test_basic_graph_creation"])
-    def test_node_types(self, explorer):
+    def test_node_types(self, explore_cached):
         """Test that different node types are created correctly."""
         word = 'cat'
-        G, node_labels = explorer.explore_word(word, depth=2, max_nodes=30)
+        G, node_labels = explore_cached(word, depth=2, max_nodes=30)
         
         node_types = {}
         for node, data in G.nodes(data=True):
@@ -45,10 +45,10 @@ class TestGraphBuilding:
         print("✅ Node types verified")
     
     @pytest.mark.dependency(depends=["TestGraphBuilding::test_node_types"])
-    def test_edge_properties(self, explorer):
+    def test_edge_properties(self, explore_cached):
         """Test that edges have proper relationship properties."""
         word = 'book'
-        G, _ = explorer.explore_word(word, depth=2, max_nodes=30, show_hypernyms=True)
+        G, _ = explore_cached(word, depth=2, max_nodes=30, show_hypernyms=True)
         
         edges_with_properties = 0
         relationship_types = set()
@@ -66,7 +66,7 @@ class TestGraphBuilding:
         print(f"✅ Edge properties verified: {relationship_types}")
     
     @pytest.mark.dependency(depends=["TestGraphBuilding::test_edge_properties"])
-    def test_depth_limiting(self, explorer):
+    def test_depth_limiting(self, explore_cached):
         """Test that depth limiting works correctly."""
         word = 'tree'
         
@@ -75,7 +75,7 @@ class TestGraphBuilding:
         node_counts = []
         
         for depth in depths_to_test:
-            G, _ = explorer.explore_word(word, depth=depth, max_nodes=50)
+            G, _ = explore_cached(word, depth=depth, max_nodes=50)
             node_counts.append(G.number_of_nodes())
             print(f"  Depth {depth}: {G.number_of_nodes()} nodes")
         
@@ -87,14 +87,14 @@ class TestGraphBuilding:
         print("✅ Depth limiting tested")
     
     @pytest.mark.dependency(depends=["TestGraphBuilding::test_depth_limiting"])
-    def test_max_nodes_limiting(self, explorer):
+    def test_max_nodes_limiting(self, explore_cached):
         """Test that max_nodes limiting works correctly."""
         word = 'animal'
         
         max_nodes_limits = [5, 10, 20]
         
         for max_nodes in max_nodes_limits:
-            G, _ = explorer.explore_word(word, depth=3, max_nodes=max_nodes)
+            G, _ = explore_cached(word, depth=3, max_nodes=max_nodes)
             actual_nodes = G.number_of_nodes()
             
             assert actual_nodes <= max_nodes, f"Should not exceed max_nodes limit: {actual_nodes} > {max_nodes}"
@@ -107,19 +107,19 @@ class TestRelationshipFiltering:
     """Test relationship type filtering and configuration."""
     
     @pytest.mark.dependency(depends=["TestGraphBuilding::test_max_nodes_limiting"])
-    def test_hypernym_filtering(self, explorer):
+    def test_hypernym_filtering(self, explore_cached):
         """Test hypernym relationship filtering."""
         word = 'car'
         
         # Test with hypernyms enabled
-        G_with, _ = explorer.explore_word(word, depth=2, max_nodes=30, show_hypernyms=True)
+        G_with, _ = explore_cached(word, depth=2, max_nodes=30, show_hypernyms=True)
         
         # Test with hypernyms disabled
-        G_without, _ = explorer.explore_word(word, depth=2, max_nodes=30, show_hypernyms=False)
+        G_without, _ = explore_cached(word, depth=2, max_nodes=30, show_hypernyms=False)
         
         # Count hypernym edges
-        hypernyms_with = sum(1 for _, _, data in G_with.edges(data=True) if data.get('relation') == 'hypernym')
-        hypernyms_without = sum(1 for _, _, data in G_without.edges(data=True) if data.get('relation') == 'hypernym')
+        hypernyms_with = sum(1 for _, _, relation in G_with.edges(data='relation') if relation == 'hypernym')
+        hypernyms_without = sum(1 for _, _, relation in G_without.edges(data='relation') if relation == 'hypernym')
         
         print(f"  With hypernyms: {hypernyms_with} hypernym edges")
         print(f"  Without hypernyms: {hypernyms_without} hypernym edges")
@@ -131,11 +131,11 @@ class TestRelationshipFiltering:
         print("✅ Hypernym filtering verified")
     
     @pytest.mark.dependency(depends=["TestRelationshipFiltering::test_hypernym_filtering"])
-    def test_multiple_relationship_types(self, explorer):
+    def test_multiple_relationship_types(self, explore_cached):
         """Test handling of multiple relationship types simultaneously."""
         word = 'hand'
         
-        G, _ = explorer.explore_word(
+        G, _ = explore_cached(
             word, 
             depth=2, 
             max_nodes=50,
@@ -146,8 +146,7 @@ class TestRelationshipFiltering:
         )
         
         relationship_counts = {}
-        for _, _, edge_data in G.edges(data=True):
-            relation = edge_data.get('relation', 'unknown')
+        for _, _, relation in G.edges(data='relation', default='unknown'):
             relationship_counts[relation] = relationship_counts.get(relation, 0) + 1
         
         print(f"  Relationship distribution: {relationship_counts}")
@@ -177,12 +176,10 @@ class TestErrorHandling:
     @pytest.mark.dependency(depends=["TestErrorHandling::test_nonexistent_word"])
     def test_empty_input(self, explorer):
         """Test handling of empty input."""
-        empty_inputs = ['', '   ', None]
+        # None is not a word and takes a different path, so only strings are checked
+        empty_inputs = ['', '   ']
         
         for empty_input in empty_inputs:
-            if empty_input is None:
-                continue  # Skip None as it would cause different behavior
-                
             try:
                 G, node_labels = explorer.explore_word(empty_input, depth=1, max_nodes=10)
                 # Should either return empty graph or handle gracefully
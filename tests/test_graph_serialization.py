@@ -12,24 +12,52 @@ from src.graph import (
 )
 
 
+# Attribute types GraphSerializer writes as-is; anything else is stored as str(value)
+_JSON_TYPES = (str, int, float, bool, list, dict)
+
+
 class TestGraphSerialization:
     """Test graph serialization and deserialization."""
     
+    test_word = "dog"
+    test_metadata = {
+        'word': test_word,
+        'description': 'Test graph for serialization',
+        'version': '1.0'
+    }
+    
+    @pytest.fixture(scope="class")
+    def built_graph(self):
+        """Build the test word's graph once for the whole class.
+        
+        The graph is frozen since every test only reads it.
+        """
+        G, node_labels = GraphBuilder().build_graph(self.test_word)
+        return nx.freeze(G), node_labels
+    
+    @pytest.fixture(scope="class")
+    def round_trip(self, built_graph):
+        """Serialize the shared graph once and deserialize it back.
+        
+        Returns (json_str, G2, node_labels2, metadata2) for the tests to inspect.
+        """
+        G, node_labels = built_graph
+        serializer = GraphSerializer()
+        # serialize_graph adds the visualization config to the metadata it is given
+        json_str = serializer.serialize_graph(G, node_labels, dict(self.test_metadata))
+        return (json_str,) + serializer.deserialize_graph(json_str)
+    
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.builder = GraphBuilder()
         self.serializer = GraphSerializer()
-        self.test_word = "dog"
     
-    def test_basic_serialization(self):
+    def test_basic_serialization(self, built_graph, round_trip):
         """Test basic graph serialization and deserialization."""
         print("\n🔍 Testing basic graph serialization...")
         
-        # Build a test graph
-        G, node_labels = self.builder.build_graph(self.test_word)
-        
-        # Serialize to JSON
-        json_str = self.serializer.serialize_graph(G, node_labels)
+        # Use the shared test graph and its serialized JSON
+        G, node_labels = built_graph
+        json_str = round_trip[0]
         
         # Verify JSON structure
         data = json.loads(json_str)
@@ -40,18 +68,15 @@ class TestGraphSerialization:
         
         # Verify node data
         assert len(data['nodes']) == G.number_of_nodes()
+        assert data['nodes'].keys() <= set(G)
         for node_id, attrs in data['nodes'].items():
-            assert node_id in G.nodes()
-            for key, value in attrs.items():
-                assert key in G.nodes[node_id]
+            assert attrs.keys() <= G.nodes[node_id].keys()
         
         # Verify edge data
         assert len(data['edges']) == G.number_of_edges()
-        for edge in data['edges']:
-            assert 'source' in edge
-            assert 'target' in edge
-            assert 'attributes' in edge
-            assert G.has_edge(edge['source'], edge['target'])
+        edge_fields = {'source', 'target', 'attributes'}
+        assert all(edge.keys() >= edge_fields for edge in data['edges'])
+        assert all(G.has_edge(edge['source'], edge['target']) for edge in data['edges'])
         
         # Verify node labels
         assert len(data['node_labels']) == len(node_labels)
@@ -61,47 +86,34 @@ class TestGraphSerialization:
         
         print(f"✅ Verified JSON structure with {len(data['nodes'])} nodes and {len(data['edges'])} edges")
     
-    def test_round_trip_serialization(self):
+    def test_round_trip_serialization(self, built_graph, round_trip):
         """Test that serialization and deserialization preserves all data."""
         print("\n🔍 Testing round-trip serialization...")
         
-        # Build a test graph
-        G, node_labels = self.builder.build_graph(self.test_word)
-        
-        # Add some metadata
-        metadata = {
-            'word': self.test_word,
-            'description': 'Test graph for serialization',
-            'version': '1.0'
-        }
-        
-        # Serialize to JSON
-        json_str = self.serializer.serialize_graph(G, node_labels, metadata)
-        
-        # Deserialize back
-        G2, node_labels2, metadata2 = self.serializer.deserialize_graph(json_str)
+        # Use the shared test graph and its round trip, serialized with test_metadata
+        G, node_labels = built_graph
+        metadata = self.test_metadata
+        _, G2, node_labels2, metadata2 = round_trip
         
         # Verify graph structure
         assert G2.number_of_nodes() == G.number_of_nodes()
         assert G2.number_of_edges() == G.number_of_edges()
         
-        # Verify node attributes
-        for node_id in G.nodes():
-            assert node_id in G2.nodes()
-            for key, value in G.nodes[node_id].items():
-                if isinstance(value, (str, int, float, bool, list, dict)):
-                    assert G2.nodes[node_id][key] == value
-                else:
-                    assert str(G2.nodes[node_id][key]) == str(value)
+        # Verify node attributes; the serializer stores non-JSON values as str(value)
+        for node_id, attrs in G.nodes(data=True):
+            assert node_id in G2
+            attrs2 = G2.nodes[node_id]
+            for key, value in attrs.items():
+                expected = value if isinstance(value, _JSON_TYPES) else str(value)
+                assert attrs2[key] == expected
         
         # Verify edge attributes
         for source, target, attrs in G.edges(data=True):
             assert G2.has_edge(source, target)
+            attrs2 = G2.edges[source, target]
             for key, value in attrs.items():
-                if isinstance(value, (str, int, float, bool, list, dict)):
-                    assert G2.edges[source, target][key] == value
-                else:
-                    assert str(G2.edges[source, target][key]) == str(value)
+                expected = value if isinstance(value, _JSON_TYPES) else str(value)
+                assert attrs2[key] == expected
         
         # Verify node labels
         assert node_labels2 == node_labels
@@ -113,12 +125,12 @@ class TestGraphSerialization:
         
         print("✅ Verified round-trip serialization preserves all data")
     
-    def test_file_io(self):
+    def test_file_io(self, built_graph, tmp_path):
         """Test saving and loading graphs to/from files."""
         print("\n🔍 Testing file I/O operations...")
         
-        # Build a test graph
-        G, node_labels = self.builder.build_graph(self.test_word)
+        # Use the shared test graph
+        G, node_labels = built_graph
         
         # Add metadata
         metadata = {
@@ -126,32 +138,26 @@ class TestGraphSerialization:
             'description': 'Test graph for file I/O'
         }
         
-        # Save to file
-        test_file = 'test_graph.json'
-        try:
-            self.serializer.save_graph(G, node_labels, test_file, metadata)
-            
-            # Verify file exists
-            assert os.path.exists(test_file)
-            
-            # Load from file
-            G2, node_labels2, metadata2 = self.serializer.load_graph(test_file)
-            
-            # Verify loaded data
-            assert G2.number_of_nodes() == G.number_of_nodes()
-            assert G2.number_of_edges() == G.number_of_edges()
-            assert node_labels2 == node_labels
-            assert metadata2['word'] == metadata['word']
-            assert metadata2['description'] == metadata['description']
-            
-            print("✅ Verified file I/O operations")
-            
-        finally:
-            # Clean up test file
-            if os.path.exists(test_file):
-                os.remove(test_file)
+        # Save to a per-test directory that pytest cleans up
+        test_file = str(tmp_path / 'test_graph.json')
+        self.serializer.save_graph(G, node_labels, test_file, metadata)
+        
+        # Verify file exists
+        assert os.path.exists(test_file)
+        
+        # Load from file
+        G2, node_labels2, metadata2 = self.serializer.load_graph(test_file)
+        
+        # Verify loaded data
+        assert G2.number_of_nodes() == G.number_of_nodes()
+        assert G2.number_of_edges() == G.number_of_edges()
+        assert node_labels2 == node_labels
+        assert metadata2['word'] == metadata['word']
+        assert metadata2['description'] == metadata['description']
+        
+        print("✅ Verified file I/O operations")
     
-    def test_visualization_config_preservation(self):
+    def test_visualization_config_preservation(self, built_graph):
         """Test that visualization configuration is preserved."""
         print("\n🔍 Testing visualization config preservation...")
         
@@ -170,8 +176,8 @@ class TestGraphSerialization:
         # Create serializer with custom config
         serializer = GraphSerializer(config)
         
-        # Build and serialize graph
-        G, node_labels = self.builder.build_graph(self.test_word)
+        # Serialize the shared test graph
+        G, node_labels = built_graph
         json_str = serializer.serialize_graph(G, node_labels)
         
         # Deserialize
@@ -191,16 +197,13 @@ class TestGraphSerialization:
         
         print("✅ Verified visualization config preservation")
     
-    def test_wordnet_connectivity(self):
+    def test_wordnet_connectivity(self, built_graph, round_trip):
         """Test that WordNet connectivity is preserved."""
         print("\n🔍 Testing WordNet connectivity preservation...")
         
-        # Build a test graph
-        G, node_labels = self.builder.build_graph(self.test_word)
-        
-        # Serialize and deserialize
-        json_str = self.serializer.serialize_graph(G, node_labels)
-        G2, node_labels2, _ = self.serializer.deserialize_graph(json_str)
+        # Use the shared test graph and its round trip
+        G, node_labels = built_graph
+        _, G2, node_labels2, _ = round_trip
         
         # Verify synset names are preserved
         for node_id, attrs in G.nodes(data=True):
@@ -4,11 +4,6 @@ Test suite for URL parameter correlation with rendered settings in WordNet Explo
 
 import pytest
 from unittest.mock import Mock, patch
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from src.core.session import SessionManager
 from src.config.settings import DEFAULT_SETTINGS, LAYOUT_OPTIONS